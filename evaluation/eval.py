@@ -2,17 +2,34 @@ import numpy as np
 from scipy.io import wavfile
 from scipy.signal import welch  # Corrected import
 
-def compute_snr(noisy_signal, clean_signal):
+def _as_float(signal, dtype=None):
+    """
+    Cast a signal to the requested floating-point precision.
+    
+    When dtype is None, floating-point input is kept as is and integer
+    PCM input is promoted to float64.
+    """
+    signal = np.asarray(signal)
+    if dtype is None:
+        dtype = signal.dtype if np.issubdtype(signal.dtype, np.floating) else np.float64
+    return signal.astype(dtype, copy=False)
+
+def compute_snr(noisy_signal, clean_signal, dtype=None):
     """
     Compute the Signal-to-Noise Ratio (SNR) between noisy and clean signals.
     
     Parameters:
         noisy_signal (numpy array): The noisy signal.
         clean_signal (numpy array): The filtered (clean) signal.
+        dtype (numpy dtype): Compute precision (float32 or float64). Defaults to
+            the input's floating-point dtype, or float64 for integer input.
     
     Returns:
         float: The SNR value in dB.
     """
+    noisy_signal = _as_float(noisy_signal, dtype)
+    clean_signal = _as_float(clean_signal, dtype)
+    
     # Ensure both signals are of the same length
     min_len = min(len(noisy_signal), len(clean_signal))
     noisy_signal = noisy_signal[:min_len]
@@ -27,7 +44,7 @@ def compute_snr(noisy_signal, clean_signal):
     snr = 10 * np.log10(signal_power / noise_power)
     return snr
 
-def spectral_flatness(signal, fs, nperseg=1024):
+def spectral_flatness(signal, fs, nperseg=1024, dtype=None):
     """
     Compute Spectral Flatness of a signal using the Welch method.
     
@@ -35,11 +52,15 @@ def spectral_flatness(signal, fs, nperseg=1024):
         signal (numpy array): The signal to compute spectral flatness for.
         fs (int): The sampling rate of the signal.
         nperseg (int): Length of each segment for analysis (default: 1024).
+        dtype (numpy dtype): Compute precision (float32 or float64). Defaults to
+            the input's floating-point dtype, or float64 for integer input.
     
     Returns:
         tuple: Spectral flatness value, frequency, and Power Spectral Density (PSD).
     """
+    signal = _as_float(signal, dtype)
     f, Pxx = welch(signal, fs=fs, nperseg=nperseg)  # Corrected to use scipy.signal.welch
+    f = f.astype(signal.dtype)
     Pxx = np.maximum(Pxx, 1e-12)  # Prevent log(0)
     geometric_mean = np.exp(np.mean(np.log(Pxx)))
     arithmetic_mean = np.mean(Pxx)
@@ -59,7 +80,7 @@ def load_wav(file_path):
     fs, signal = wavfile.read(file_path)
     return fs, signal
 
-def main(noisy_file, filtered_file):
+def main(noisy_file, filtered_file, dtype=None):
     """
     Main function to process both WAV files, calculate SNR and Spectral Flatness,
     and display the results.
@@ -67,6 +88,8 @@ def main(noisy_file, filtered_file):
     Parameters:
         noisy_file (str): Path to the noisy WAV file.
         filtered_file (str): Path to the filtered (cleaned) WAV file.
+        dtype (numpy dtype): Compute precision (float32 or float64). Defaults to
+            float64, since the WAV files are read as integer PCM.
     """
     # Load WAV files
     fs_noisy, noisy_signal = load_wav(noisy_file)
@@ -77,12 +100,12 @@ def main(noisy_file, filtered_file):
         raise ValueError("The sampling rates of both files must be the same!")
 
     # Calculate SNR
-    snr = compute_snr(noisy_signal, filtered_signal)
+    snr = compute_snr(noisy_signal, filtered_signal, dtype=dtype)
     print(f"SNR (Filtered vs Noisy): {snr:.2f} dB")
 
     # Calculate Spectral Flatness
-    flat_noisy, _, _ = spectral_flatness(noisy_signal, fs_noisy)
-    flat_filtered, _, _ = spectral_flatness(filtered_signal, fs_filtered)
+    flat_noisy, _, _ = spectral_flatness(noisy_signal, fs_noisy, dtype=dtype)
+    flat_filtered, _, _ = spectral_flatness(filtered_signal, fs_filtered, dtype=dtype)
 
     print(f"Spectral Flatness - Noisy: {flat_noisy:.4f}")
     print(f"Spectral Flatness - Filtered: {flat_filtered:.4f}")
@@ -0,0 +1,234 @@
+import json
+import os
+import tempfile
+import time
+import numpy as np
+import scipy.fft
+from numpy.typing import DTypeLike
+from scipy import signal
+from typing import Callable, Dict, List, Optional
+
+PLAN_PATH_ENV = "DENOISING_AUDIO_PLAN_PATH"
+
+# Strategy rankings settle well below this, so longer inputs are benchmarked
+# on a truncated signal to bound the first-run cost
+MAX_BENCHMARK_LENGTH = 1 << 18
+
+
+def default_plan_path() -> str:
+    """
+    Resolve the plan file location: $DENOISING_AUDIO_PLAN_PATH if set, otherwise
+    filter_plan.json under $XDG_CACHE_HOME (or ~/.cache)/denoising_audio.
+    """
+    if os.environ.get(PLAN_PATH_ENV):
+        return os.environ[PLAN_PATH_ENV]
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "denoising_audio", "filter_plan.json")
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs this process may run on, honouring affinity masks where supported.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _apply_lfilter(fir_coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Direct-form FIR filtering.
+    """
+    return signal.lfilter(fir_coeffs, np.ones(1, dtype=x.dtype), x)
+
+
+def _apply_oaconvolve(fir_coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Overlap-add convolution with SciPy's automatic block size.
+    """
+    return signal.oaconvolve(x, fir_coeffs)[:len(x)]
+
+
+def _apply_fft_overlap_add(fir_coeffs: np.ndarray, x: np.ndarray, nfft: int, workers: int) -> np.ndarray:
+    """
+    Overlap-add convolution with an explicit FFT size, transforming all blocks
+    in one batched (and optionally multithreaded) scipy.fft call.
+    """
+    num_taps = len(fir_coeffs)
+    block = nfft - num_taps + 1
+    num_blocks = -(-len(x) // block)
+
+    frames = np.zeros((num_blocks, block), dtype=x.dtype)
+    frames.reshape(-1)[:len(x)] = x
+
+    spectrum = scipy.fft.rfft(frames, n=nfft, axis=-1, workers=workers)
+    spectrum *= scipy.fft.rfft(fir_coeffs, n=nfft)
+    filtered = scipy.fft.irfft(spectrum, n=nfft, axis=-1, workers=workers)
+
+    # Each block's tail (num_taps - 1 samples) spills into the next block only
+    out = np.zeros((num_blocks + 1) * block, dtype=x.dtype)
+    out[:num_blocks * block] += filtered[:, :block].reshape(-1)
+    out[block:].reshape(num_blocks, block)[:, :num_taps - 1] += filtered[:, block:block + num_taps - 1]
+    return out[:len(x)]
+
+
+STRATEGIES: Dict[str, Callable[..., np.ndarray]] = {
+    "lfilter": _apply_lfilter,
+    "oaconvolve": _apply_oaconvolve,
+    "fft_overlap_add": _apply_fft_overlap_add,
+}
+
+
+class FilterPlanner:
+    """
+    Pick the fastest FIR filtering strategy for this machine and remember it.
+
+    On the first request for a (num_taps, length bucket, dtype) combination the
+    candidate strategies are benchmarked and the winner is written to a JSON
+    plan file. Later runs read the plan back and skip the benchmark. If the
+    plan file cannot be written, the plan is kept in memory only.
+    """
+
+    def __init__(self, plan_path: Optional[str] = None, repeats: int = 3):
+        """
+        Args:
+            plan_path (str): JSON file the plans are persisted to
+                             (defaults to default_plan_path())
+            repeats (int): Timing runs per candidate; the fastest run counts
+        """
+        if repeats < 1:
+            raise ValueError(f"repeats must be at least 1, got {repeats}")
+        self.plan_path = plan_path or default_plan_path()
+        self.repeats = repeats
+        self.plans = self._load_plans()
+
+    @staticmethod
+    def length_bucket(length: int) -> int:
+        """
+        Round a signal length up to the next power of two.
+        """
+        return 1 << max(length - 1, 0).bit_length()
+
+    @staticmethod
+    def plan_key(num_taps: int, length: int, dtype: DTypeLike) -> str:
+        """
+        Build the key a plan is stored under.
+        """
+        return f"{num_taps}:{FilterPlanner.length_bucket(length)}:{np.dtype(dtype).name}"
+
+    def candidates(self, num_taps: int, length: int) -> List[Dict]:
+        """
+        List the strategy configurations worth benchmarking for this problem size.
+        """
+        candidates = [{"strategy": "lfilter"}, {"strategy": "oaconvolve"}]
+
+        worker_counts = sorted({1, available_cpus()})
+        largest = scipy.fft.next_fast_len(length + num_taps - 1, real=True)
+        smallest = scipy.fft.next_fast_len(2 * num_taps, real=True)
+        nfft_sizes = sorted({min(scipy.fft.next_fast_len(smallest * factor, real=True), largest)
+                             for factor in (1, 4, 16, 64)})
+        nfft_sizes = [nfft for nfft in nfft_sizes if nfft >= 2 * num_taps - 2]
+
+        for nfft in nfft_sizes:
+            for workers in worker_counts:
+                candidates.append({"strategy": "fft_overlap_add", "nfft": nfft, "workers": workers})
+        return candidates
+
+    def plan(self, num_taps: int, length: int, dtype: DTypeLike = np.float64) -> Dict:
+        """
+        Return the cached plan for this problem size, benchmarking on a miss.
+        """
+        key = self.plan_key(num_taps, length, dtype)
+        plan = self.plans.get(key)
+        if not self._is_valid(plan, num_taps, length):
+            plan = self._benchmark(num_taps, length, np.dtype(dtype))
+            self.plans[key] = plan
+            self._save_plans(key)
+        return plan
+
+    def apply(self, fir_coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Filter x with fir_coeffs using the planned strategy.
+
+        Args:
+            fir_coeffs (np.ndarray): FIR filter coefficients
+            x (np.ndarray): Signal to filter
+
+        Returns:
+            np.ndarray: Filtered signal, same length and dtype as x
+        """
+        fir_coeffs = np.asarray(fir_coeffs, dtype=x.dtype)
+        plan = self.plan(len(fir_coeffs), len(x), x.dtype)
+        return self._run(plan, fir_coeffs, x)
+
+    def _is_valid(self, plan, num_taps: int, length: int) -> bool:
+        """
+        Check that a cached plan is one of the candidates for this problem size.
+        """
+        if not isinstance(plan, dict):
+            return False
+        options = {name: value for name, value in plan.items() if name != "seconds"}
+        return options in self.candidates(num_taps, self._benchmark_length(length))
+
+    @staticmethod
+    def _benchmark_length(length: int) -> int:
+        return min(FilterPlanner.length_bucket(length), MAX_BENCHMARK_LENGTH)
+
+    @staticmethod
+    def _run(plan: Dict, fir_coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+        options = {name: value for name, value in plan.items() if name not in ("strategy", "seconds")}
+        return STRATEGIES[plan["strategy"]](fir_coeffs, x, **options)
+
+    def _benchmark(self, num_taps: int, length: int, dtype: np.dtype) -> Dict:
+        rng = np.random.default_rng(0)
+        bench_length = self._benchmark_length(length)
+        x = rng.standard_normal(bench_length).astype(dtype)
+        fir_coeffs = rng.standard_normal(num_taps).astype(dtype)
+
+        best = None
+        for candidate in self.candidates(num_taps, bench_length):
+            self._run(candidate, fir_coeffs, x)  # warm-up (FFT plan caches, thread pools)
+            seconds = float("inf")
+            for _ in range(self.repeats):
+                start = time.perf_counter()
+                self._run(candidate, fir_coeffs, x)
+                seconds = min(seconds, time.perf_counter() - start)
+                # Stop timing candidates that already lost to the current best
+                if best is not None and seconds > best["seconds"]:
+                    break
+            if best is None or seconds < best["seconds"]:
+                best = dict(candidate, seconds=seconds)
+        return best
+
+    def _load_plans(self) -> Dict[str, Dict]:
+        try:
+            with open(self.plan_path) as f:
+                plans = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return plans if isinstance(plans, dict) else {}
+
+    def _save_plans(self, key: str):
+        """
+        Merge the plan for key into the file on disk, so concurrent planners
+        tuning other keys don't lose their entries. Failures are ignored.
+        """
+        directory = os.path.dirname(self.plan_path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            plans = self._load_plans()
+            plans[key] = self.plans[key]
+            tmp_path = None
+            try:
+                with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False) as f:
+                    tmp_path = f.name
+                    json.dump(plans, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.plan_path)
+                tmp_path = None
+            finally:
+                # Don't leave the temp file behind if the dump or replace failed
+                if tmp_path is not None:
+                    os.unlink(tmp_path)
+        except OSError:
+            return
+        self.plans.update(plans)
@@ -2,11 +2,13 @@ import os
 import pathlib
 from signal_loader import SignalLoader
 from signal_processing import FrequencyAnalyzer
+from filter_planner import FilterPlanner
 from visualization import SignalVisualizer
 
 def main():
     audio_file_path = "dataset/seg_114.wav"
     base_results_dir = 'results'
+    compute_dtype = None  # follow the input; np.float32 halves memory traffic for 16-bit sources
     
     try:
         audio_filename = pathlib.Path(audio_file_path).stem
@@ -14,12 +16,12 @@ def main():
         os.makedirs(results_dir, exist_ok=True)
         
         # Load and normalize signal
-        loader = SignalLoader(audio_file_path)
+        loader = SignalLoader(audio_file_path, dtype=compute_dtype)
         signal, sample_rate = loader.load_signal()
         normalized_signal = loader.normalize_signal()
         
         # Frequency analysis
-        analyzer = FrequencyAnalyzer(normalized_signal, sample_rate)
+        analyzer = FrequencyAnalyzer(normalized_signal, sample_rate, dtype=compute_dtype)
         dominant_frequencies = analyzer.identify_dominant_frequencies()
         noise_characteristics = analyzer.compute_noise_characteristics()
         
@@ -31,7 +33,7 @@ def main():
         fir_coeffs = analyzer.design_fir_filter(noise_bands)
         
         # Apply FIR filter
-        filtered_signal = analyzer.apply_fir_filter(fir_coeffs)
+        filtered_signal = analyzer.apply_fir_filter(fir_coeffs, planner=FilterPlanner())
         
         # Save filtered signal
         filtered_audio_path = os.path.join(results_dir, "filtered_audio.wav")
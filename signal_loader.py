@@ -1,5 +1,6 @@
 import numpy as np
 import soundfile as sf
+from numpy.typing import DTypeLike
 from typing import Tuple
 
 class SignalLoader:
@@ -7,8 +8,18 @@ class SignalLoader:
     A class to load and preprocess audio signals.
     """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, dtype: DTypeLike = None):
+        """
+        Args:
+            file_path (str): Path to the audio file
+            dtype: Compute precision (np.float32 or np.float64). Defaults to the
+                   file's sample format: FLOAT files decode to float32, DOUBLE and
+                   PCM files to float64.
+        """
         self.file_path = file_path
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        if self.dtype is not None and self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported dtype: {self.dtype}. Use float32 or float64.")
         self.signal = None
         self.sample_rate = None
     
@@ -17,9 +28,12 @@ class SignalLoader:
         Load the audio signal from the file.
         """
         try:
-            self.signal, self.sample_rate = sf.read(self.file_path)
+            dtype = self.dtype
+            if dtype is None:
+                dtype = np.dtype(np.float32 if sf.info(self.file_path).subtype == "FLOAT" else np.float64)
+            self.signal, self.sample_rate = sf.read(self.file_path, dtype=dtype.name)
             if self.signal.ndim > 1:
-                self.signal = np.mean(self.signal, axis=1)
+                self.signal = np.mean(self.signal, axis=1, dtype=dtype)
             return self.signal, self.sample_rate
         except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {self.file_path}")
@@ -36,6 +50,11 @@ class SignalLoader:
         if signal is None:
             raise ValueError("No signal loaded. Call load_signal() first.")
         
+        signal = np.asarray(signal)
+        dtype = self.dtype
+        if dtype is None:
+            dtype = signal.dtype if np.issubdtype(signal.dtype, np.floating) else np.float64
+        signal = signal.astype(dtype, copy=False)
         return signal / np.max(np.abs(signal))
     
     def save_signal(self, signal: np.ndarray, output_path: str):
@@ -1,6 +1,9 @@
 import numpy as np
+import scipy.fft
+from numpy.typing import DTypeLike
 from scipy import signal
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
+from filter_planner import FilterPlanner
 
 class FrequencyAnalyzer:
     """
@@ -8,11 +11,23 @@ class FrequencyAnalyzer:
     Now includes FIR filtering for noise removal.
     """
     
-    def __init__(self, signal: np.ndarray, sample_rate: int):
+    def __init__(self, signal: np.ndarray, sample_rate: int, dtype: DTypeLike = None):
         """
         Initialize the FrequencyAnalyzer with a signal and its sample rate.
+        
+        Args:
+            signal (np.ndarray): Input audio signal
+            sample_rate (int): Sample rate of the signal
+            dtype: Compute precision (np.float32 or np.float64). Defaults to the
+                   signal's own floating-point dtype, or float64 for integer input.
         """
-        self.signal = signal
+        signal = np.asarray(signal)
+        if dtype is None:
+            dtype = signal.dtype if np.issubdtype(signal.dtype, np.floating) else np.float64
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"Unsupported dtype: {self.dtype}. Use float32 or float64.")
+        self.signal = np.asarray(signal, dtype=self.dtype)
         self.sample_rate = sample_rate
     
     def compute_fft(self) -> Tuple[np.ndarray, np.ndarray]:
@@ -22,8 +37,8 @@ class FrequencyAnalyzer:
             - frequencies: Array of frequency bins
             - magnitudes: Corresponding magnitude values
         """
-        fft_values = np.fft.fft(self.signal)
-        frequencies = np.fft.fftfreq(len(self.signal), 1/self.sample_rate)
+        fft_values = scipy.fft.fft(self.signal)
+        frequencies = scipy.fft.fftfreq(len(self.signal), 1/self.sample_rate).astype(self.dtype)
         magnitudes = np.abs(fft_values)
         
         # Return only positive frequencies
@@ -39,7 +54,7 @@ class FrequencyAnalyzer:
             fs=self.sample_rate, 
             nperseg=1024
         )
-        return frequencies, psd
+        return frequencies.astype(self.dtype), psd
     
     def identify_dominant_frequencies(self, top_n: int = 5) -> Dict[float, float]:
         """
@@ -103,16 +118,22 @@ class FrequencyAnalyzer:
             raise ValueError("Frequency values must be nondecreasing")
         
         fir_coeffs = signal.firwin2(num_taps, bands, desired, window="hamming")
-        return fir_coeffs
+        return fir_coeffs.astype(self.dtype)
     
-    def apply_fir_filter(self, fir_coeffs: np.ndarray) -> np.ndarray:
+    def apply_fir_filter(self, fir_coeffs: np.ndarray, planner: Optional[FilterPlanner] = None) -> np.ndarray:
         """
         Apply the designed FIR filter to the signal.
         
         Args:
             fir_coeffs (np.ndarray): FIR filter coefficients
+            planner (FilterPlanner): Optional planner that picks the fastest
+                                     filtering strategy for this machine.
+                                     Without one, lfilter is used directly.
         
         Returns:
             np.ndarray: Filtered signal
         """
-        return signal.lfilter(fir_coeffs, 1.0, self.signal)
\ No newline at end of file
+        fir_coeffs = np.asarray(fir_coeffs, dtype=self.dtype)
+        if planner is not None:
+            return planner.apply(fir_coeffs, self.signal)
+        return signal.lfilter(fir_coeffs, np.ones(1, dtype=self.dtype), self.signal)
\ No newline at end of file
@@ -0,0 +1,103 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from filter_planner import FilterPlanner
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("length", [1, 5, 100, 1000, 44100])
+@pytest.mark.parametrize("num_taps", [1, 2, 3, 101, 1001])
+def test_candidates_match_lfilter(tmp_path, num_taps, length, dtype):
+    rng = np.random.default_rng(num_taps * length)
+    x = rng.standard_normal(length).astype(dtype)
+    fir_coeffs = rng.standard_normal(num_taps).astype(dtype)
+    expected = signal.lfilter(fir_coeffs.astype(np.float64), 1.0, x.astype(np.float64))
+    tolerance = 1e-4 if dtype == np.float32 else 1e-8
+
+    planner = FilterPlanner(str(tmp_path / "plan.json"))
+    for candidate in planner.candidates(num_taps, length):
+        filtered = FilterPlanner._run(candidate, fir_coeffs, x)
+        assert filtered.dtype == dtype, candidate
+        assert filtered.shape == x.shape, candidate
+        scale = max(np.max(np.abs(expected)), 1.0)
+        assert np.max(np.abs(filtered - expected)) / scale < tolerance, candidate
+
+
+def test_plan_round_trips_through_file(tmp_path, monkeypatch):
+    plan_path = str(tmp_path / "plan.json")
+    plan = FilterPlanner(plan_path, repeats=1).plan(101, 5000, np.float32)
+
+    with open(plan_path) as f:
+        assert json.load(f) == {FilterPlanner.plan_key(101, 5000, np.float32): plan}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached plan was not reused")
+
+    monkeypatch.setattr(FilterPlanner, "_benchmark", fail)
+    assert FilterPlanner(plan_path).plan(101, 5000, np.float32) == plan
+
+
+@pytest.mark.parametrize("entry", [{"strategy": "fft_overlap_add"}, {"strategy": "unknown"}, "lfilter", None])
+def test_invalid_cached_plan_is_rebenchmarked(tmp_path, entry):
+    plan_path = str(tmp_path / "plan.json")
+    key = FilterPlanner.plan_key(101, 5000, np.float64)
+    with open(plan_path, "w") as f:
+        json.dump({key: entry}, f)
+
+    planner = FilterPlanner(plan_path, repeats=1)
+    plan = planner.plan(101, 5000, np.float64)
+    assert plan != entry
+    assert planner._is_valid(plan, 101, 5000)
+
+
+def test_save_merges_entries_from_other_planners(tmp_path):
+    plan_path = str(tmp_path / "plan.json")
+    first = FilterPlanner(plan_path, repeats=1)
+    second = FilterPlanner(plan_path, repeats=1)
+    first.plan(11, 1000, np.float64)
+    second.plan(21, 1000, np.float64)
+
+    with open(plan_path) as f:
+        assert set(json.load(f)) == {
+            FilterPlanner.plan_key(11, 1000, np.float64),
+            FilterPlanner.plan_key(21, 1000, np.float64),
+        }
+    assert os.listdir(tmp_path) == ["plan.json"]
+
+
+def test_unwritable_plan_path_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    planner = FilterPlanner(str(blocker / "plan.json"), repeats=1)
+
+    x = np.random.default_rng(0).standard_normal(1000)
+    fir_coeffs = signal.firwin(31, 0.2)
+    np.testing.assert_allclose(planner.apply(fir_coeffs, x), signal.lfilter(fir_coeffs, 1.0, x), atol=1e-10)
+
+
+def test_failed_replace_leaves_no_temp_file(tmp_path):
+    plan_path = tmp_path / "plan.json"
+    plan_path.mkdir()
+    planner = FilterPlanner(str(plan_path), repeats=1)
+
+    assert planner.plan(31, 1000, np.float64)
+    assert os.listdir(tmp_path) == ["plan.json"]
+
+
+@pytest.mark.parametrize("repeats", [0, -1])
+def test_repeats_must_be_positive(tmp_path, repeats):
+    with pytest.raises(ValueError):
+        FilterPlanner(str(tmp_path / "plan.json"), repeats=repeats)
+
+
+def test_plan_path_env_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("DENOISING_AUDIO_PLAN_PATH", str(tmp_path / "custom.json"))
+    assert FilterPlanner().plan_path == str(tmp_path / "custom.json")
+
+    monkeypatch.delenv("DENOISING_AUDIO_PLAN_PATH")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert FilterPlanner().plan_path == str(tmp_path / "denoising_audio" / "filter_plan.json")
@@ -0,0 +1,92 @@
+import os
+
+import numpy as np
+import pytest
+
+import soundfile as sf
+
+from evaluation.eval import compute_snr, spectral_flatness
+from filter_planner import FilterPlanner
+from signal_loader import SignalLoader
+from signal_processing import FrequencyAnalyzer
+
+AUDIO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dataset", "seg_1.wav")
+NOISE_BANDS = [(48, 51), (84, 87), (99, 101), (1196, 1199)]
+
+# Measured -131.5 dB on seg_1 with NOISE_BANDS; the bound leaves headroom for
+# differences between BLAS/FFT backends.
+MAX_ERROR_DB = -100.0
+
+
+def run_pipeline(dtype):
+    loader = SignalLoader(AUDIO_PATH, dtype=dtype)
+    signal, sample_rate = loader.load_signal()
+    normalized = loader.normalize_signal()
+    analyzer = FrequencyAnalyzer(normalized, sample_rate)
+    fir_coeffs = analyzer.design_fir_filter(NOISE_BANDS)
+    filtered = analyzer.apply_fir_filter(fir_coeffs)
+    return {
+        "signal": signal,
+        "normalized": normalized,
+        "analyzer_signal": analyzer.signal,
+        "fir_coeffs": fir_coeffs,
+        "filtered": filtered,
+    }
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_pipeline_keeps_dtype(dtype):
+    for name, array in run_pipeline(dtype).items():
+        assert array.dtype == dtype, name
+
+
+def test_float32_matches_float64_within_bound():
+    y64 = run_pipeline(np.float64)["filtered"]
+    y32 = run_pipeline(np.float32)["filtered"].astype(np.float64)
+
+    error_db = 10 * np.log10(np.sum((y32 - y64) ** 2) / np.sum(y64 ** 2))
+    assert error_db < MAX_ERROR_DB
+
+
+def test_float32_analysis_and_evaluation_stay_float32(tmp_path):
+    loader = SignalLoader(AUDIO_PATH, dtype=np.float32)
+    _, sample_rate = loader.load_signal()
+    normalized = loader.normalize_signal()
+    analyzer = FrequencyAnalyzer(normalized, sample_rate)
+
+    frequencies, magnitudes = analyzer.compute_fft()
+    assert frequencies.dtype == np.float32
+    assert magnitudes.dtype == np.float32
+
+    frequencies, psd = analyzer.compute_power_spectral_density()
+    assert frequencies.dtype == np.float32
+    assert psd.dtype == np.float32
+
+    for name, value in analyzer.compute_noise_characteristics().items():
+        assert np.asarray(value).dtype == np.float32, name
+
+    fir_coeffs = analyzer.design_fir_filter(NOISE_BANDS)
+    planner = FilterPlanner(str(tmp_path / "plan.json"), repeats=1)
+    filtered = analyzer.apply_fir_filter(fir_coeffs, planner=planner)
+    assert filtered.dtype == np.float32
+    np.testing.assert_allclose(filtered, analyzer.apply_fir_filter(fir_coeffs), atol=1e-5)
+
+    assert np.asarray(compute_snr(normalized, filtered)).dtype == np.float32
+    flatness, frequencies, psd = spectral_flatness(filtered, sample_rate)
+    assert np.asarray(flatness).dtype == np.float32
+    assert frequencies.dtype == np.float32
+    assert psd.dtype == np.float32
+
+
+def test_default_dtype_follows_float_wav_subtype(tmp_path):
+    path = str(tmp_path / "float.wav")
+    sf.write(path, np.linspace(-0.5, 0.5, 100), 8000, subtype="FLOAT")
+
+    signal, _ = SignalLoader(path).load_signal()
+    assert signal.dtype == np.float32
+    assert SignalLoader(AUDIO_PATH).load_signal()[0].dtype == np.float64
+
+
+def test_analyzer_accepts_array_like_input():
+    analyzer = FrequencyAnalyzer([0.1, 0.2, 0.3], 8000)
+    assert analyzer.signal.dtype == np.float64